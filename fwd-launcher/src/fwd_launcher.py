@@ -1,8 +1,10 @@
 import argparse
+import sys
 from pathlib import Path
+from typing import Optional
 
-from fwdnagaoka.fwd_nagaoka import FwdNagaoka
-from fwdutil import logger_initializer
+# fwdnagaoka, fwdutil はSQLAlchemy, Jinja2等を読み込み重いため、
+# 実行するコマンドの処理関数内でのみimportする
 
 CONFIG_DIR = Path(__file__).parents[2] / "config"
 CONFIG_FILE_PATH = CONFIG_DIR / "fwd_config.yaml"
@@ -14,48 +16,70 @@ def create_config_file(args):
 
 
 def setup_fwd(args):
+    from fwdnagaoka.fwd_nagaoka import FwdNagaoka
+
     FwdNagaoka.setup()
 
 
 def execute_nagaoka(args):
+    from fwdnagaoka.fwd_nagaoka import FwdNagaoka
+    from fwdutil import logger_initializer
+
     logger_initializer.initialize(LOG_FORMAT_FILE_PATH)
     fwd_nagaoka = FwdNagaoka()
     fwd_nagaoka.execute()
 
 
 def store_old_nagaoka(args):
+    from fwdnagaoka.fwd_nagaoka import FwdNagaoka
+    from fwdutil import logger_initializer
+
     logger_initializer.initialize(LOG_FORMAT_FILE_PATH)
     fwdNagaoka = FwdNagaoka()
     fwdNagaoka.store_old_data(args.text_dir)
 
 
-def _create_argparser() -> argparse.ArgumentParser:
-    # parser本体、supparserを作成する
-    argparser = argparse.ArgumentParser()
-    subparsers = argparser.add_subparsers()
+def _add_store_old_nagaoka_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("text_dir", type=str)
 
-    # 設定ファイルを作成するコマンド定義
-    parser_create_config = subparsers.add_parser("create_config")
-    parser_create_config.set_defaults(func=create_config_file)
 
+# コマンド名と、(引数を定義する関数, コマンドの処理関数) の対応
+COMMANDS = {
+    # 設定ファイルを作成するコマンド定義
+    "create_config": (None, create_config_file),
     # 各FWDクラスをセットアップするコマンド定義
-    parser_setup_fwd = subparsers.add_parser("setup_fwd")
-    parser_setup_fwd.set_defaults(func=setup_fwd)
-
+    "setup_fwd": (None, setup_fwd),
     # 長岡市の処理を実行するコマンド定義
-    parser_execute_nagaoka = subparsers.add_parser("execute_nagaoka")
-    parser_execute_nagaoka.set_defaults(func=execute_nagaoka)
-
+    "execute_nagaoka": (None, execute_nagaoka),
     # 長岡市の過去データを設定するコマンド定義
-    parser_store_old_nagaoka = subparsers.add_parser("store_old_nagaoka")
-    parser_store_old_nagaoka.add_argument("text_dir", type=str)
-    parser_store_old_nagaoka.set_defaults(func=store_old_nagaoka)
+    "store_old_nagaoka": (_add_store_old_nagaoka_arguments, store_old_nagaoka),
+}
+
+
+def _create_argparser(command_name: Optional[str] = None) -> argparse.ArgumentParser:
+    # parser本体、supparserを作成する
+    # command_name が指定された場合は、そのコマンドのsubparserのみを作成する
+    argparser = argparse.ArgumentParser()
+    subparsers = argparser.add_subparsers()
+    for name, (add_arguments, func) in COMMANDS.items():
+        if command_name is not None and name != command_name:
+            continue
+        parser = subparsers.add_parser(name)
+        if add_arguments is not None:
+            add_arguments(parser)
+        parser.set_defaults(func=func)
 
     # parser本体を返却
     return argparser
 
 
-if __name__ == "__main__":
-    argparser = _create_argparser()
+def main():
+    # 既知のコマンドが指定された場合はそのコマンドのみ、それ以外（ヘルプ表示など）は全コマンドを定義する
+    command_name = sys.argv[1] if len(sys.argv) > 1 else None
+    argparser = _create_argparser(command_name if command_name in COMMANDS else None)
     args = argparser.parse_args()
     args.func(args)
+
+
+if __name__ == "__main__":
+    main()
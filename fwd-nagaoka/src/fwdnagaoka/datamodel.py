@@ -1,17 +1,172 @@
 import datetime
-from enum import Enum, auto
+from enum import Enum
+from typing import Final
 
 import sqlalchemy
 from fwdutil import database_manager
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    TypeDecorator,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# データベースのバージョン（テーブル定義・保存形式を変更した場合は値を上げ、更新処理を追加する）
+#   1: Enumを名前の文字列で保存する（_database_info にバージョン未登録）
+#   2: Enumを値（数値）で保存する
+DATABASE_VERSION: Final[int] = 2
+
+# テーブル再作成時に、既存のテーブルを退避する名前の接頭辞
+_OLD_TABLE_PREFIX: Final[str] = "_old_"
+
 
 def create_table_all():
-    Base.metadata.create_all(bind=database_manager.ENGINE)
+    """テーブルを作成し、既存のデータベースを現在のバージョンに更新する"""
+    with database_manager.ENGINE.connect() as connection:
+        # テーブル再作成時に外部キー制約によるCASCADE削除が行われないよう、制約を無効にする
+        # （PRAGMA foreign_keys はトランザクション外でのみ変更できる）
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        try:
+            # DDLを含めて一つのトランザクションで実行するため、明示的に開始する
+            # （sqlite3モジュールはDML以外ではトランザクションを開始しない）
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                if _get_database_version(connection) < 2:
+                    _upgrade_to_version_2(connection)
+
+                Base.metadata.create_all(bind=connection)
+
+                # 作成済みのテーブルには後から追加したインデックスが作成されないため個別に作成する
+                for table in Base.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(bind=connection, checkfirst=True)
+
+                connection.execute(
+                    sqlite_insert(DatabaseInfo)
+                    .values(id=1, version=DATABASE_VERSION)
+                    .on_conflict_do_update(
+                        index_elements=[DatabaseInfo.id],
+                        set_={"version": DATABASE_VERSION},
+                    )
+                )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        finally:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+def upgrade_database():
+    """データベースが現在のバージョンでない場合に、テーブルの作成・更新を行う
+
+    定期実行の開始時に呼び出し、更新後に setup を再実行しなくても動作するようにする。
+    """
+    with database_manager.ENGINE.connect() as connection:
+        if sqlalchemy.inspect(connection).has_table(DatabaseInfo.__tablename__):
+            version = connection.scalar(
+                sqlalchemy.select(DatabaseInfo.version).where(DatabaseInfo.id == 1)
+            )
+            if version == DATABASE_VERSION:
+                return
+    create_table_all()
+
+
+def _get_database_version(connection: Connection) -> int:
+    """データベースのバージョンを取得する
+
+    Args:
+        connection (Connection): 取得に使用するコネクション
+
+    Returns:
+        int: データベースのバージョン（テーブル未作成の場合は現在のバージョン）
+    """
+    inspector = sqlalchemy.inspect(connection)
+    if inspector.has_table(DatabaseInfo.__tablename__):
+        version = connection.scalar(
+            sqlalchemy.select(DatabaseInfo.version).where(DatabaseInfo.id == 1)
+        )
+        if version is not None:
+            return version
+
+    # バージョン未登録の場合、テーブルがあれば最初のバージョンとする
+    if inspector.has_table(NagaokaRawText.__tablename__):
+        return 1
+    return DATABASE_VERSION
+
+
+def _upgrade_to_version_2(connection: Connection):
+    """Enumを保存する列を、名前の文字列から値（数値）に変換する
+
+    SQLiteは列の型を変更できないため、テーブルを退避して新しい定義で作成し直し、
+    Enumの名前を値に変換しながらデータを移す。
+
+    Args:
+        connection (Connection): 更新に使用するコネクション
+    """
+    inspector = sqlalchemy.inspect(connection)
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if inspector.has_table(table.name)
+        and any(isinstance(column.type, IntEnumType) for column in table.columns)
+    ]
+
+    # 既存のテーブルを退避する（新しいテーブルと名前が重複するインデックスは削除する）
+    for table in reversed(tables):
+        for index in table.indexes:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+        connection.exec_driver_sql(
+            f"ALTER TABLE {table.name} RENAME TO {_OLD_TABLE_PREFIX}{table.name}"
+        )
+
+    # 新しい定義でテーブルを作成し、退避したテーブルからデータを移す
+    # （一意制約に反する重複した文字列は登録しない）
+    Base.metadata.create_all(bind=connection, tables=tables)
+    for table in tables:
+        old_table = sqlalchemy.table(
+            f"{_OLD_TABLE_PREFIX}{table.name}",
+            *(sqlalchemy.column(column.name) for column in table.columns),
+        )
+        select_columns = []
+        for column in table.columns:
+            old_column = old_table.c[column.name]
+            if isinstance(column.type, IntEnumType):
+                # Enumの名前を値に変換する（名前以外が保存されている場合はそのまま移す）
+                old_column = sqlalchemy.case(
+                    {member.name: member.value for member in column.type.enum_class},
+                    value=old_column,
+                    else_=old_column,
+                )
+            select_columns.append(old_column)
+        connection.execute(
+            sqlalchemy.insert(table)
+            .prefix_with("OR IGNORE")
+            .from_select(table.columns, sqlalchemy.select(*select_columns))
+        )
+
+    # 重複により登録しなかった文字列の解析結果を削除する
+    connection.execute(
+        sqlalchemy.delete(NagaokaDisasterDetail).where(
+            NagaokaDisasterDetail.raw_text_id.not_in(
+                sqlalchemy.select(NagaokaRawText.id)
+            )
+        )
+    )
+
+    # 退避したテーブルを削除する
+    for table in reversed(tables):
+        connection.exec_driver_sql(f"DROP TABLE {_OLD_TABLE_PREFIX}{table.name}")
 
 
 class DatabaseInfo(Base):
@@ -26,42 +181,86 @@ class DatabaseInfo(Base):
     version = Column(Integer, nullable=False)
 
 
+class IntEnumType(TypeDecorator):
+    """Enumの値（数値）をSmallIntegerとしてDBに保存する型
+
+    Args:
+        enum_class (type[Enum]): 保存するEnumクラス（値が数値であること）
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        # 変換のたびにEnumを検索しないよう、変換表を作成しておく
+        self._enum_to_value = {member: member.value for member in enum_class}
+        self._value_to_enum = {member.value: member for member in enum_class}
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else self._enum_to_value[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._value_to_enum[value]
+
+
+# 以下のEnumは値をDBに保存するため、既存の値は変更しないこと
+
+
 class TextPosition(Enum):
-    CURR = auto()
-    PAST = auto()
+    CURR = 1
+    PAST = 2
 
 
 class NotifyStatus(Enum):
-    SKIPPED = auto()
-    NOT_YET = auto()
-    NOTIFIED = auto()
+    SKIPPED = 1
+    NOT_YET = 2
+    NOTIFIED = 3
 
 
 class DisasterMainCategory(Enum):
-    火災 = auto()
-    救助 = auto()
-    警戒 = auto()
-    救急支援 = auto()
-    その他 = auto()
+    火災 = 1
+    救助 = 2
+    警戒 = 3
+    救急支援 = 4
+    その他 = 5
 
 
 class DisasterStatus(Enum):
-    発生 = auto()
-    救助終了 = auto()
-    消火不要 = auto()
-    鎮圧 = auto()
-    鎮火 = auto()
-    終了 = auto()
+    発生 = 1
+    救助終了 = 2
+    消火不要 = 3
+    鎮圧 = 4
+    鎮火 = 5
+    終了 = 6
+
+
+class NagaokaWebpageInfo(Base):
+    """長岡市の災害情報Webページの、前回取得時の情報を管理する（条件付きGETに使用する）
+
+    Args:
+        Base (_type_): declarative_base() によって取得した基底クラス
+    """
+
+    __tablename__ = "nagaoka_webpage_info"
+    id = Column(Integer, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
 
 
 class NagaokaRawText(Base):
     __tablename__ = "nagaoka_raw_text"
+    __table_args__ = (
+        # 同一掲載位置の同一文字列は一度だけ登録する
+        Index("uq_nagaoka_raw_text_pos_text", "text_pos", "raw_text", unique=True),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     raw_text = Column(String, nullable=False)
-    retr_dt = Column(DateTime, nullable=False, default=datetime.datetime.now())
-    text_pos = Column(sqlalchemy.Enum(TextPosition), nullable=False)
+    retr_dt = Column(DateTime, nullable=False, default=datetime.datetime.now)
+    text_pos = Column(IntEnumType(TextPosition), nullable=False)
     notify_status = Column(
-        sqlalchemy.Enum(NotifyStatus), nullable=False, default=NotifyStatus.NOT_YET
+        IntEnumType(NotifyStatus), nullable=False, default=NotifyStatus.NOT_YET
     )
     detail_info = relationship("NagaokaDisasterDetail", uselist=False)
 
@@ -76,7 +275,7 @@ class NagaokaDisasterDetail(Base):
     )
     """災害種別
     """
-    main_category = Column(sqlalchemy.Enum(DisasterMainCategory), nullable=False)
+    main_category = Column(IntEnumType(DisasterMainCategory), nullable=False)
     """災害種別詳細
     """
     sub_category = Column(String, nullable=True)
@@ -88,7 +287,7 @@ class NagaokaDisasterDetail(Base):
     close_dt = Column(DateTime, nullable=True)
     """災害状態
     """
-    status = Column(sqlalchemy.Enum(DisasterStatus), nullable=False)
+    status = Column(IntEnumType(DisasterStatus), nullable=False)
     """住所1（長岡市以外の場合の都市名）
     """
     address1 = Column(String, nullable=True)
@@ -1,12 +1,15 @@
 import datetime
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Final, Optional
 
+import requests
 import sqlalchemy
 from fwdutil import config, database_manager, request_wrapper
 from jinja2 import Environment, FileSystemLoader
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm.session import Session
 
 from fwdnagaoka.datamodel import (
@@ -14,9 +17,54 @@ from fwdnagaoka.datamodel import (
     DisasterStatus,
     NagaokaDisasterDetail,
     NagaokaRawText,
+    NagaokaWebpageInfo,
     NotifyStatus,
     TextPosition,
     create_table_all,
+    upgrade_database,
+)
+
+# 通知文テンプレートの読み込み環境（全インスタンスで共有する）
+_TEMPLATE_DIR = Path(__file__).parents[2] / "resource" / "template"
+_J2_ENV = Environment(loader=FileSystemLoader(_TEMPLATE_DIR), auto_reload=False)
+
+# 「現在」「過去」それぞれの災害情報の範囲を示す文字列
+_CURR_BEGIN_MARK = "↓現在発生している災害↓"
+_CURR_END_MARK = "↑現在発生している災害↑"
+_PAST_BEGIN_MARK = "↓過去の災害経過情報↓"
+_PAST_END_MARK = "↑過去の災害経過情報↑"
+
+# 災害情報の解析に使用する正規表現
+_SPAN_RE = re.compile(r"<span>(\d{2}月\d{2}日.+?。)</span>")
+# 災害文字列全体（発生時刻、都市名、住所、災害種別、状態）を一度に解析する
+# 発生時刻（MM月DD日 HH:MM）は文字列先頭の固定位置にあるため、グループとしては取得しない
+_TEXT_RE = re.compile(
+    r"\d{2}月\d{2}日 \d{2}:\d{2} (?P<city>\S+?) "
+    r"(?P<address>.+?)(に|の)(?P<category>\S+?)(は|のため)(?P<status>.+)。"
+)
+
+# 災害情報の文字列を一度にDBへ送信する件数
+_INSERT_CHUNK_SIZE = 1000
+
+# 解析・通知対象の災害情報を一度にDBから取得する件数
+_FETCH_CHUNK_SIZE = 200
+
+# 災害種別の判定に使用する文字列と災害種別の対応（先頭から順に判定する）
+_CATEGORY_TABLE = (
+    ("火災", DisasterMainCategory.火災),
+    ("救助", DisasterMainCategory.救助),
+    ("警戒", DisasterMainCategory.警戒),
+    ("救急", DisasterMainCategory.救急支援),
+)
+
+# 災害状態の判定に使用する文字列と災害状態、終了時刻解析要否の対応（先頭から順に判定する）
+# 災害状態がNoneの場合は、文字列の掲載位置により災害状態を決定する
+_STATUS_TABLE = (
+    ("消防車が出動しました", None, False),
+    ("救助終了しました", DisasterStatus.救助終了, True),
+    ("消火の必要はありませんでした", DisasterStatus.消火不要, False),
+    ("鎮圧しました", DisasterStatus.鎮圧, True),
+    ("鎮火しました", DisasterStatus.鎮火, True),
 )
 
 
@@ -27,8 +75,7 @@ class FwdNagaoka:
     def __init__(self):
         """コンストラクタ"""
         self._logger = logging.getLogger("fwd.nagaoka")
-        _template_dir = Path(__file__).parents[2] / "resource" / "template"
-        self._j2_env = Environment(loader=FileSystemLoader(_template_dir))
+        self._notify_template = _J2_ENV.get_template("notify.j2")
         self._webhook_url = config.get_webhook_url("nagaoka")
 
     @staticmethod
@@ -40,24 +87,37 @@ class FwdNagaoka:
         """災害情報の取得から通知までの一連の処理を実行する"""
         try:
             self._logger.info("execute() 実行開始")
-            # Webから災害情報テキストを取得
-            webpage_text = request_wrapper.download_webpage(
-                FwdNagaoka.WEBPAGE_URL, FwdNagaoka.WEBPAGE_ENC
-            )
+            # データベースを現在のバージョンに更新（更新済みの場合は何もしない）
+            upgrade_database()
 
-            # 災害情報テキストを前処理・分割
-            webpage_text_dev = self._split_webtext(
-                self._cleansing_webtext(webpage_text)
+            # Webから災害情報テキストを取得（前回取得時から更新されていない場合はNone）
+            etag, last_modified = self._load_webpage_info()
+            download_result = request_wrapper.download_webpage_if_modified(
+                FwdNagaoka.WEBPAGE_URL, FwdNagaoka.WEBPAGE_ENC, etag, last_modified
             )
+            webpage_text, etag, last_modified = download_result
 
-            # 災害情報（現在発生している災害）をDBへ登録
-            self._commit_disaster_list_curr(webpage_text_dev[0])
+            # 災害情報の登録から解析までを一つのトランザクションで行う
+            with database_manager.session_factory() as session:
+                if webpage_text is None:
+                    # 更新されていない場合、災害情報の登録は行わない
+                    self._logger.info("Webページ更新なしのため災害情報の登録をスキップ")
+                else:
+                    # 災害情報テキストを前処理・分割
+                    webpage_text_dev = self._split_webtext(
+                        self._cleansing_webtext(webpage_text)
+                    )
 
-            # 災害情報（過去の災害情報）をDBへ登録
-            self._commit_disaster_list_past(webpage_text_dev[1])
+                    # 災害情報（現在発生している災害・過去の災害情報）をDBへ登録
+                    self._register_disaster_list(
+                        session, webpage_text_dev[0], webpage_text_dev[1]
+                    )
 
-            # 災害情報の解析
-            self._analyze()
+                    # 登録したWebページの情報を保存
+                    self._save_webpage_info(session, etag, last_modified)
+
+                # 災害情報の解析（前回までに解析できなかった災害情報も対象とする）
+                self._analyze(session)
 
             # 災害情報の通知
             self._notify()
@@ -70,51 +130,134 @@ class FwdNagaoka:
         # TODO: 過去データのインポート機能追加
         self._logger.info("store_old_data() 実行開始")
         try:
-            # 指定されたディレクトリ内の対象ファイル一覧を検索する
-            text_dir_path = Path(text_dir)
-            text_files = [_ for _ in text_dir_path.glob("*.txt")]
+            # データベースを現在のバージョンに更新（更新済みの場合は何もしない）
+            upgrade_database()
+
+            # 指定されたディレクトリ内の対象ファイル一覧を、ファイル名（取得日時）順に検索する
+            with os.scandir(text_dir) as entries:
+                text_files = sorted(
+                    (
+                        entry
+                        for entry in entries
+                        if entry.name.endswith(".txt") and entry.is_file()
+                    ),
+                    key=lambda entry: entry.name,
+                )
 
-            # テキストファイルから災害情報を読み込み、解析処理を行う
+            # テキストファイルから災害情報を読み込み、登録する情報を作成する
             self._logger.info("災害情報の登録開始")
+            raw_text_rows: list[dict] = []
             for index, text_file in enumerate(text_files):
                 # ファイル名から実行時刻を取得する
-                filename_m = re.match(
-                    r"(?P<date_time_str>\d{8}_\d{4})\.txt", text_file.name
-                )
-                if not filename_m:
-                    self._logger.info(f"ファイル名不正のためスキップ：{text_file.name}")
+                retrieve_time = self._get_retrieve_dt_from_filename(text_file.name)
+                if retrieve_time is None:
+                    self._logger.info("ファイル名不正のためスキップ：%s", text_file.name)
                     continue
                 else:
                     self._logger.info(
-                        f"災害情報の登録[{index + 1}/{len(text_files)}]：{text_file.name}"
+                        "災害情報の登録[%d/%d]：%s",
+                        index + 1,
+                        len(text_files),
+                        text_file.name,
                     )
-                retrieve_time = datetime.datetime.strptime(
-                    filename_m.group("date_time_str"), "%Y%m%d_%H%M"
-                )
 
                 # ファイルから読み込む
-                webpage_text = text_file.read_text(encoding="utf-8")
+                with open(text_file.path, encoding="utf-8") as f:
+                    webpage_text = f.read()
 
                 # 災害情報テキストを前処理・分割
                 webpage_text_dev = self._split_webtext(
                     self._cleansing_webtext(webpage_text)
                 )
 
-                # 災害情報（現在発生している災害）をDBへ登録
-                self._commit_disaster_list_curr(webpage_text_dev[0], retrieve_time)
+                # 災害情報（現在発生している災害）の登録情報を作成
+                raw_text_rows += self._create_raw_text_rows(
+                    webpage_text_dev[0], TextPosition.CURR, retrieve_time
+                )
+
+                # 災害情報（過去の災害情報）の登録情報を作成
+                raw_text_rows += self._create_raw_text_rows(
+                    webpage_text_dev[1], TextPosition.PAST, retrieve_time
+                )
 
-                # 災害情報（過去の災害情報）をDBへ登録
-                self._commit_disaster_list_past(webpage_text_dev[1], retrieve_time)
+            # 全ファイルの災害情報の登録と解析を一つのトランザクションで行う
+            with database_manager.session_factory() as session:
+                inserted_count = self._insert_raw_text_rows(session, raw_text_rows)
+                self._logger.info("災害情報の登録件数=[%d]", inserted_count)
 
-            # 災害情報の解析
-            self._logger.info("災害情報の登録完了・解析開始")
-            self._analyze()
+                # 災害情報の解析
+                self._logger.info("災害情報の登録完了・解析開始")
+                self._analyze(session)
             self._logger.info("災害情報の解析完了")
 
         except Exception:
             self._logger.exception("store_old_data() 実行失敗")
         self._logger.info("store_old_data() 実行終了")
 
+    @staticmethod
+    def _get_retrieve_dt_from_filename(filename: str) -> Optional[datetime.datetime]:
+        """過去データのファイル名（YYYYMMDD_HHMM.txt）から実行時刻を取得する
+
+        Args:
+            filename (str): 過去データのファイル名
+
+        Returns:
+            Optional[datetime.datetime]: 実行時刻。ファイル名が不正な場合はNone。
+        """
+        # 固定位置の数字を切り出して日時を作成する
+        if not (
+            len(filename) == 17
+            and filename.endswith(".txt")
+            and filename[8] == "_"
+            and filename[0:8].isdecimal()
+            and filename[9:13].isdecimal()
+        ):
+            return None
+        try:
+            return datetime.datetime(
+                year=int(filename[0:4]),
+                month=int(filename[4:6]),
+                day=int(filename[6:8]),
+                hour=int(filename[9:11]),
+                minute=int(filename[11:13]),
+            )
+        except ValueError:
+            # 日付・時刻として存在しない値の場合
+            return None
+
+    def _load_webpage_info(self) -> tuple[Optional[str], Optional[str]]:
+        """前回取得時のWebページの情報を取得する
+
+        Returns:
+            tuple[Optional[str], Optional[str]]: ETag、Last-Modified（未取得の場合はNone）
+        """
+        session: Session = database_manager.SESSION()
+        try:
+            webpage_info = session.get(NagaokaWebpageInfo, 1)
+            if webpage_info is None:
+                return None, None
+            return webpage_info.etag, webpage_info.last_modified
+        finally:
+            session.close()
+
+    def _save_webpage_info(
+        self, session: Session, etag: Optional[str], last_modified: Optional[str]
+    ):
+        """取得したWebページの情報を保存する（コミットは呼び出し元で行う）
+
+        Args:
+            session (Session): 保存に使用するセッション
+            etag (Optional[str]): 取得したWebページのETag
+            last_modified (Optional[str]): 取得したWebページのLast-Modified
+        """
+        try:
+            session.merge(
+                NagaokaWebpageInfo(id=1, etag=etag, last_modified=last_modified)
+            )
+        except Exception:
+            self._logger.error("Webページ情報の保存失敗")
+            raise
+
     def _cleansing_webtext(self, webpage_text: str) -> str:
         """htmlテキスト解析前に、前処理として整形処理を行う
         Args:
@@ -123,7 +266,7 @@ class FwdNagaoka:
         Returns:
             str: 前処理後のWebページテキスト
         """
-        return re.sub(r"\u3000", " ", webpage_text)
+        return webpage_text.replace("\u3000", " ")
 
     def _split_webtext(self, webpage_text: str) -> list[str]:
         """htmlテキストを、「現在発生している災害」が記載されている部分と「過去の災害」が記載されている部分に分割する
@@ -138,279 +281,257 @@ class FwdNagaoka:
             list[str]: [0]: 現在発生している災害の文字列、[1]: 過去の災害の文字列
         """
 
-        # 「現在」「過去」それぞれの災害情報を検索する
-        pat = re.compile(
-            r".+↓現在発生している災害↓(.+)↑現在発生している災害↑.+↓過去の災害経過情報↓(.+)↑過去の災害経過情報↑.+",
-            re.DOTALL,
-        )
-
+        # 「現在」「過去」それぞれの災害情報の範囲を検索する
         # 検索に失敗した場合はValueErrorとする（災害情報掲示の仕様変更などの場合を想定）
-        if not (m := pat.match(webpage_text)):
-            raise ValueError("現在/過去の災害情報分割失敗")
+        try:
+            curr_begin = webpage_text.index(_CURR_BEGIN_MARK) + len(_CURR_BEGIN_MARK)
+            curr_end = webpage_text.index(_CURR_END_MARK, curr_begin)
+            past_begin = webpage_text.index(_PAST_BEGIN_MARK, curr_end) + len(
+                _PAST_BEGIN_MARK
+            )
+            past_end = webpage_text.index(_PAST_END_MARK, past_begin)
+        except ValueError:
+            raise ValueError("現在/過去の災害情報分割失敗") from None
 
         # 検索結果を返却
         return [
-            m.group(1),
-            m.group(2),
+            webpage_text[curr_begin:curr_end],
+            webpage_text[past_begin:past_end],
         ]
 
-    def _commit_disaster_list_curr(self, webpage_text_curr: str, execute_dt=None):
-        """「現在発生している災害」の文字列を抽出してDBに登録する
+    def _register_disaster_list(self, session: Session, curr_text: str, past_text: str):
+        """「現在」「過去」の災害情報の文字列を抽出し、まとめてDBに登録する（コミットは呼び出し元で行う）
 
         Args:
-            webpage_text_curr (str): 「現在発生している災害」の文字列
-            execute_dt (datetime.datetime, optional): 文字列を取得した日時. Defaults to None.
+            session (Session): 登録に使用するセッション
+            curr_text (str): 「現在発生している災害」の文字列
+            past_text (str): 「過去の災害」の文字列
         """
-
-        session: Session = database_manager.SESSION()
-
-        # 災害情報の文字列を検索する
         try:
-            # execute_dt の指定状況に応じ、登録する情報を決定する
-            retrieve_dt = datetime.datetime.now() if execute_dt is None else execute_dt
-            notify_stat = (
-                NotifyStatus.NOT_YET if execute_dt is None else NotifyStatus.SKIPPED
-            )
-
-            # 文字列解析
-            matches = re.findall(
-                r"<span>(\d{2}月\d{2}日.+?。)</span>", webpage_text_curr
-            )
-
-            for match_str in matches[::-1]:
-                # 登録済みかを確認する
-                registered = bool(
-                    session.query(NagaokaRawText)
-                    .filter(NagaokaRawText.raw_text == match_str)
-                    .filter(NagaokaRawText.text_pos == TextPosition.CURR)
-                    .count()
-                )
-
-                # 登録されていない場合は登録する
-                if not registered:
-                    # 登録する情報を作成する
-                    raw_text_data = NagaokaRawText(
-                        raw_text=match_str,
-                        retr_dt=retrieve_dt,
-                        text_pos=TextPosition.CURR,
-                        notify_status=notify_stat,
-                    )
-                    # DBに送信する
-                    session.add(raw_text_data)
-
-                    # DBにコミットする
-                    session.commit()
-                    self._logger.info(
-                        f"「現在」の災害情報登録完了 ID=[{raw_text_data.id}]"
-                    )
+            # 登録する情報を「現在」「過去」の順に作成し、まとめてDBに送信する
+            raw_text_rows = self._create_raw_text_rows(curr_text, TextPosition.CURR)
+            raw_text_rows += self._create_raw_text_rows(past_text, TextPosition.PAST)
+            inserted_count = self._insert_raw_text_rows(session, raw_text_rows)
+            self._logger.info("災害情報登録完了 件数=[%d]", inserted_count)
 
         except Exception:
-            # 解析に失敗した場合はロールバックする
-            self._logger.error("「現在」の災害情報登録失敗")
-            session.rollback()
+            self._logger.error("災害情報登録失敗")
             raise
-        finally:
-            session.close()
 
-    def _commit_disaster_list_past(self, webpage_text_past: str, execute_dt=None):
-        """「過去の災害」の文字列を抽出してDBに登録する
+    def _create_raw_text_rows(
+        self, webpage_text: str, text_pos: TextPosition, execute_dt=None
+    ) -> list[dict]:
+        """災害情報の文字列を抽出し、DBに登録する情報を作成する
 
         Args:
-            webpage_text_past (str): 「過去の災害」の文字列
+            webpage_text (str): 「現在発生している災害」または「過去の災害」の文字列
+            text_pos (TextPosition): 文字列の掲載位置
             execute_dt (datetime.datetime, optional): 文字列を取得した日時. Defaults to None.
-        """
-        session: Session = database_manager.SESSION()
 
-        try:
-            # execute_dt の指定状況に応じ、登録する情報を決定する
-            retrieve_dt = datetime.datetime.now() if execute_dt is None else execute_dt
-            notify_stat = (
+        Returns:
+            list[dict]: DBに登録する情報（古い順）
+        """
+        # execute_dt の指定状況に応じ、登録する情報を決定する
+        # （execute_dt 未指定の場合、retr_dtには登録時の日時が設定される）
+        common_values = {
+            "text_pos": text_pos,
+            "notify_status": (
                 NotifyStatus.NOT_YET if execute_dt is None else NotifyStatus.SKIPPED
-            )
+            ),
+        }
+        if execute_dt is not None:
+            common_values["retr_dt"] = execute_dt
 
-            # 災害情報の文字列を検索する
-            matches = re.findall(
-                r"<span>(\d{2}月\d{2}日.+?。)</span>", webpage_text_past
-            )
-            for match_str in matches[::-1]:
-                # 登録済みかを確認する
-                registered = bool(
-                    session.query(NagaokaRawText)
-                    .filter(NagaokaRawText.raw_text == match_str)
-                    .filter(NagaokaRawText.text_pos == TextPosition.PAST)
-                    .count()
-                )
-                # 登録されていない場合は登録する
-                if not registered:
-                    # 登録する情報を作成する
-                    raw_text_data = NagaokaRawText(
-                        raw_text=match_str,
-                        retr_dt=retrieve_dt,
-                        text_pos=TextPosition.PAST,
-                        notify_status=notify_stat,
-                    )
-                    session.add(raw_text_data)
+        # 災害情報の文字列を検索し、登録する情報を古い順に作成する
+        # （Webページには新しい順に掲載されているため、リストを直接反転させる）
+        matches = _SPAN_RE.findall(webpage_text)
+        matches.reverse()
+        return [{"raw_text": match_str, **common_values} for match_str in matches]
 
-                    # DBにコミットする
-                    session.commit()
-                    self._logger.info(
-                        f"「過去」の災害情報登録完了 ID=[{raw_text_data.id}]"
-                    )
+    def _insert_raw_text_rows(self, session: Session, raw_text_rows: list[dict]) -> int:
+        """DBに登録する情報を一括で送信する（コミットは呼び出し元で行う）
 
-        except Exception:
-            # 解析に失敗した場合はロールバックする
-            self._logger.error("「過去」の災害情報登録失敗")
-            session.rollback()
-            raise
-        finally:
-            session.close()
+        登録済みの文字列は、一意制約により登録をスキップする。
 
-    def _analyze(self):
-        """災害文字列の解析を実行する"""
+        Args:
+            session (Session): 送信に使用するセッション
+            raw_text_rows (list[dict]): DBに登録する情報
 
-        session: Session = database_manager.SESSION()
+        Returns:
+            int: 登録した件数
+        """
+        # ORMを経由すると登録件数（rowcount）を取得できないため、
+        # セッションのコネクションに直接送信する
+        stmt = sqlite_insert(NagaokaRawText).on_conflict_do_nothing()
+        connection = session.connection()
+        inserted_count = 0
+        for index in range(0, len(raw_text_rows), _INSERT_CHUNK_SIZE):
+            result = connection.execute(
+                stmt, raw_text_rows[index : index + _INSERT_CHUNK_SIZE]
+            )
+            inserted_count += result.rowcount
+        return inserted_count
+
+    def _analyze(self, session: Session):
+        """災害文字列の解析を実行する（コミットは呼び出し元で行う）
 
+        Args:
+            session (Session): 解析に使用するセッション
+        """
         try:
-            # 分析対象のNagaokaRawText一覧をDBから取得する
-            not_analyzed_list = (
-                session.query(NagaokaRawText)
-                .filter(NagaokaRawText.detail_info == sqlalchemy.null())
-                .all()
+            # 分析対象の災害情報をDBから取得する（解析に必要な列のみ、一定件数ずつ取得する）
+            # 取得中の結果に影響しないよう、DBへの送信は全件の解析後に行う
+            not_analyzed_list = session.execute(
+                sqlalchemy.select(
+                    NagaokaRawText.id,
+                    NagaokaRawText.raw_text,
+                    NagaokaRawText.retr_dt,
+                    NagaokaRawText.text_pos,
+                )
+                .outerjoin(NagaokaDisasterDetail)
+                .where(NagaokaDisasterDetail.raw_text_id.is_(None))
+                .execution_options(yield_per=_FETCH_CHUNK_SIZE)
             )
 
             # 分析処理を実行する
+            detail_list: list[dict] = []
+            skipped_id_list: list[int] = []
             for raw_text_data in not_analyzed_list:
-                self._logger.info(f"ID=[{raw_text_data.id}] の文字列解析処理開始")
-                detail_data = self._analyze_text(raw_text_data)
-
-                # statusが「終了」の場合は通知不要を設定する
-                if detail_data.status == DisasterStatus.終了:
-                    raw_text_data.notify_status = NotifyStatus.SKIPPED
-
-                # 分析結果をDBに送信しコミットする
-                session.add(detail_data)
-                session.commit()
-                self._logger.info(f"ID=[{raw_text_data.id}] の文字列解析処理完了")
+                self._logger.info("ID=[%d] の文字列解析処理開始", raw_text_data.id)
+                try:
+                    detail_data = self._analyze_text(raw_text_data)
+                except ValueError as err:
+                    # 解析できない文字列は未解析のまま残し、登録済みの災害情報は保持する
+                    # （解析処理の修正後、次回以降の実行時に再度解析する）
+                    self._logger.warning(
+                        "ID=[%d] の文字列解析処理失敗（%s）：%s",
+                        raw_text_data.id,
+                        err,
+                        raw_text_data.raw_text,
+                    )
+                    continue
+                detail_list.append(detail_data)
+
+                # statusが「終了」の場合は通知不要とする
+                if detail_data["status"] == DisasterStatus.終了:
+                    skipped_id_list.append(raw_text_data.id)
+                self._logger.info("ID=[%d] の文字列解析処理完了", raw_text_data.id)
+
+            # 分析結果をDBに一括で送信する
+            if detail_list:
+                session.execute(sqlalchemy.insert(NagaokaDisasterDetail), detail_list)
+
+            # 通知不要とした災害情報の通知状態を一括で更新する
+            if skipped_id_list:
+                session.execute(
+                    sqlalchemy.update(NagaokaRawText)
+                    .where(NagaokaRawText.id.in_(skipped_id_list))
+                    .values(notify_status=NotifyStatus.SKIPPED)
+                )
 
         except Exception:
-            # 解析に失敗した場合は処理をロールバックする
             self._logger.error("文字列解析処理失敗")
-            session.rollback()
             raise
-        finally:
-            session.close()
 
-    def _analyze_text(self, raw_text_data: NagaokaRawText) -> NagaokaDisasterDetail:
+    def _analyze_text(self, raw_text_data: sqlalchemy.engine.Row) -> dict:
         """災害文字列の解析ロジック
 
         Args:
-            raw_text_data (NagaokaRawText): 解析対象の災害情報
+            raw_text_data (sqlalchemy.engine.Row): 解析対象の災害情報（id, raw_text, retr_dt, text_pos）
 
         Raises:
             ValueError: 解析処理に失敗した場合
 
         Returns:
-            NagaokaDisasterDetail: 解析結果情報
+            dict: 解析結果情報（NagaokaDisasterDetailの列名をキーとする辞書）
         """
         try:
-            # 解析結果を格納するインスタンス生成
-            detail_data = NagaokaDisasterDetail()
-
-            # raw_text_idを設定する
-            detail_data.raw_text_id = raw_text_data.id
-
-            # 一回目の解析（発生時刻、都市名を解析する）
-            m_1st = re.match(
-                r"(?P<month>\d{2})月(?P<day>\d{2})日 (?P<hour>\d{2}):(?P<minute>\d{2}) (?P<city>\S+?) (?P<next>.+)。$",
-                raw_text_data.raw_text,
-            )
-            if not m_1st:
-                raise ValueError("一回目の解析失敗")
+            # 解析結果を格納する辞書を生成し、raw_text_idを設定する
+            # （解析結果に含まれない場合NULLとなる項目は、あらかじめNoneを設定する）
+            detail_data = {
+                "raw_text_id": raw_text_data.id,
+                "close_dt": None,
+            }
+
+            # 災害文字列を解析する（発生時刻、都市名、住所、災害種別、状態）
+            raw_text = raw_text_data.raw_text
+            m_text = _TEXT_RE.fullmatch(raw_text)
+            if not m_text:
+                raise ValueError("災害文字列の解析失敗")
+
+            # 発生時刻の月を取得する（解析成功時、文字列先頭は「MM月DD日 HH:MM」）
+            open_month = int(raw_text[0:2])
 
             # 災害発生時刻の年を決定する
-            # 基本的にはanalyze_dt の年を設定するが、
-            # analyze_dt.month < m_1st.month の場合は前年と判定して
-            # analyze_dt.year - 1 を設定する
-            open_year = raw_text_data.retr_dt.year
-            if raw_text_data.retr_dt.month < int(m_1st.group("month")):
+            # 基本的にはretr_dt の年を設定するが、
+            # retr_dt.month < 発生時刻の月 の場合は前年と判定して
+            # retr_dt.year - 1 を設定する
+            retr_dt = raw_text_data.retr_dt
+            open_year = retr_dt.year
+            if retr_dt.month < open_month:
                 open_year -= 1
 
             # 災害発生時刻を決定する
-            detail_data.open_dt = datetime.datetime(
+            detail_data["open_dt"] = datetime.datetime(
                 year=open_year,
-                month=int(m_1st.group("month")),
-                day=int(m_1st.group("day")),
-                hour=int(m_1st.group("hour")),
-                minute=int(m_1st.group("minute")),
+                month=open_month,
+                day=int(raw_text[3:5]),
+                hour=int(raw_text[7:9]),
+                minute=int(raw_text[10:12]),
             )
 
             # 都市名を決定する
             # "長岡市"以外の場合はその都市名を設定し、"長岡市"の場合はNoneを設定
-            detail_data.address1 = (
-                m_1st.group("city") if m_1st.group("city") != "長岡市" else None
+            detail_data["address1"] = (
+                m_text["city"] if m_text["city"] != "長岡市" else None
             )
 
-            # 二回目の解析（災害種別、住所、状態を解析する）
-            m_2nd = re.match(
-                r"(?P<address>.+?)(に|の)(?P<category>\S+?)(は|のため)(?P<status>.+)$",
-                m_1st.group("next"),
-            )
-            if not m_2nd:
-                raise ValueError("二回目の解析失敗")
-
             # 災害種別を決定する
-            category_str = m_2nd.group("category")
-            if re.search(r"火災", category_str):
-                detail_data.main_category = DisasterMainCategory.火災
-            elif re.search(r"救助", category_str):
-                detail_data.main_category = DisasterMainCategory.救助
-            elif re.search(r"警戒", category_str):
-                detail_data.main_category = DisasterMainCategory.警戒
-            elif re.search(r"救急", category_str):
-                detail_data.main_category = DisasterMainCategory.救急支援
+            category_str = m_text["category"]
+            for keyword, main_category in _CATEGORY_TABLE:
+                if keyword in category_str:
+                    detail_data["main_category"] = main_category
+                    break
             else:
-                detail_data.main_category = DisasterMainCategory.その他
+                detail_data["main_category"] = DisasterMainCategory.その他
 
             # 災害種別詳細を設定する
-            detail_data.sub_category = category_str
+            detail_data["sub_category"] = category_str
 
-            # 住所を空白で分割しaddress2とaddress3を設定する
+            # 住所を最初の空白で分割しaddress2とaddress3を設定する
             # address3に該当する部分が無い場合はNULLとする
-            addr2, addr3 = m_2nd.group("address").split(" ")
-            detail_data.address2 = addr2
-            if addr3:
-                detail_data.address3 = addr3
+            addr2, _, addr3 = m_text["address"].partition(" ")
+            detail_data["address2"] = addr2
+            detail_data["address3"] = addr3 or None
 
             # 状態を決定する
-            status_str = m_2nd.group("status")
-            if re.search(r"消防車が出動しました", status_str):
-                if raw_text_data.text_pos == TextPosition.CURR:
-                    detail_data.status = DisasterStatus.発生
-                else:
-                    detail_data.status = DisasterStatus.終了
-            elif re.search(r"救助終了しました", status_str):
-                detail_data.status = DisasterStatus.救助終了
-                detail_data.close_dt = self._get_close_dt(
-                    status_str, detail_data.open_dt
-                )
-            elif re.search(r"消火の必要はありませんでした", status_str):
-                detail_data.status = DisasterStatus.消火不要
-            elif re.search(r"鎮圧しました", status_str):
-                detail_data.status = DisasterStatus.鎮圧
-                detail_data.close_dt = self._get_close_dt(
-                    status_str, detail_data.open_dt
-                )
-            elif re.search(r"鎮火しました", status_str):
-                detail_data.status = DisasterStatus.鎮火
-                detail_data.close_dt = self._get_close_dt(
-                    status_str, detail_data.open_dt
-                )
+            status_str = m_text["status"]
+            for keyword, status, needs_close_dt in _STATUS_TABLE:
+                if keyword in status_str:
+                    if status is None:
+                        status = (
+                            DisasterStatus.発生
+                            if raw_text_data.text_pos == TextPosition.CURR
+                            else DisasterStatus.終了
+                        )
+                    detail_data["status"] = status
+                    break
             else:
-                detail_data.status = DisasterStatus.終了
+                detail_data["status"] = DisasterStatus.終了
+                needs_close_dt = False
+
+            # 終了時刻が記載される状態の場合は終了時刻を解析する
+            if needs_close_dt:
+                detail_data["close_dt"] = self._get_close_dt(
+                    status_str, detail_data["open_dt"]
+                )
             # 解析結果を返却する
 
             return detail_data
 
+        except ValueError:
+            # 解析できない文字列の場合は、呼び出し元でログを出力する
+            raise
         except Exception:
             # 解析に失敗した場合
             self._logger.error("災害文字列の解析に失敗")
@@ -428,23 +549,24 @@ class FwdNagaoka:
         Returns:
             Optional[datetime.datetime]: 災害終了時刻情報。含まれていなかった場合はNone。
         """
-        # 文字列から災害終了時刻の時・分を解析する
-        close_dt_m = re.match(r"(?P<hour>\d{2}):(?P<minute>\d{2}).+$", status_str)
+        # 文字列先頭の「HH:MM」が災害終了時刻の時・分であるかを確認する
+        has_close_time = (
+            len(status_str) > 5
+            and status_str[2] == ":"
+            and status_str[0:2].isdecimal()
+            and status_str[3:5].isdecimal()
+        )
 
         # 災害終了時刻を決定する
-        if not close_dt_m:
+        if not has_close_time:
             # 災害終了時刻が記載されていない場合はNoneを返却する
             return None
         else:
             # 災害発生時刻、文字列解析結果を考慮して終了時刻を決定する
 
             # いったん、災害発生と同日に終了したものとして時刻を設定する
-            close_dt = datetime.datetime(
-                year=open_dt.year,
-                month=open_dt.month,
-                day=open_dt.day,
-                hour=int(close_dt_m.group("hour")),
-                minute=int(close_dt_m.group("minute")),
+            close_dt = open_dt.replace(
+                hour=int(status_str[0:2]), minute=int(status_str[3:5])
             )
 
             # close_dt < open_dt の場合は、翌日に終了したとして一日進める
@@ -459,31 +581,65 @@ class FwdNagaoka:
         session: Session = database_manager.SESSION()
 
         try:
-            # 通知が必要な災害情報を検索する
-            not_notified_list = (
-                session.query(NagaokaRawText)
-                .filter(NagaokaRawText.notify_status.is_(NotifyStatus.NOT_YET))
-                .all()
-            )
-
-            # 通知を実行する
-            for raw_text_data in not_notified_list:
-                # 通知文の作成
-                notify_text = self._create_notify_text(raw_text_data.detail_info)
-                # 通知の実行
-                request_wrapper.post_to_discord(self._webhook_url, notify_text)
-                # 状態を通知済みに更新
-                raw_text_data.notify_status = NotifyStatus.NOTIFIED
-                session.commit()
+            # 通知が必要な災害情報の解析結果を、登録順に一定件数ずつ取得する
+            not_notified_list = session.execute(
+                sqlalchemy.select(NagaokaDisasterDetail)
+                .join(NagaokaRawText)
+                .where(NagaokaRawText.notify_status.is_(NotifyStatus.NOT_YET))
+                .order_by(NagaokaRawText.id)
+                .execution_options(yield_per=_FETCH_CHUNK_SIZE)
+            ).scalars()
+
+            # 通知を登録順に実行する
+            # 通知に成功した災害情報は一定件数ごとに通知済みに更新し、途中で処理が
+            # 中断した場合も通知済みの災害情報を再通知しないよう、残りを最後に更新する
+            notified_id_list: list[int] = []
+            try:
+                for detail_data in not_notified_list:
+                    # 通知文の作成
+                    notify_text = self._create_notify_text(detail_data)
+                    # 通知の実行（失敗した場合は以降の災害情報も未通知のまま残し、
+                    # 次回実行時に登録順に再度通知する）
+                    try:
+                        request_wrapper.post_to_discord(self._webhook_url, notify_text)
+                    except requests.RequestException:
+                        self._logger.error(
+                            "ID=[%d] の通知失敗", detail_data.raw_text_id
+                        )
+                        break
+                    notified_id_list.append(detail_data.raw_text_id)
+
+                    if len(notified_id_list) >= _FETCH_CHUNK_SIZE:
+                        self._update_notified(notified_id_list)
+                        notified_id_list.clear()
+            finally:
+                self._update_notified(notified_id_list)
 
         except Exception:
-            # 通知に失敗した場合は処理をロールバックする
             self._logger.error("通知処理失敗")
-            session.rollback()
             raise
         finally:
             session.close()
 
+    def _update_notified(self, raw_text_id_list: list[int]):
+        """通知に成功した災害情報の状態を一括で通知済みに更新する
+
+        通知対象を取得中のsessionとは別のsessionで更新・コミットする
+        （WALモードのため、取得中の結果には影響しない）
+
+        Args:
+            raw_text_id_list (list[int]): 通知に成功した災害情報文字列のID
+        """
+        if not raw_text_id_list:
+            return
+
+        with database_manager.session_factory() as session:
+            session.execute(
+                sqlalchemy.update(NagaokaRawText)
+                .where(NagaokaRawText.id.in_(raw_text_id_list))
+                .values(notify_status=NotifyStatus.NOTIFIED)
+            )
+
     def _create_notify_text(self, detail_data: NagaokaDisasterDetail) -> str:
         """通知文を作成する
 
@@ -494,9 +650,8 @@ class FwdNagaoka:
             str: 作成した通知文
         """
         try:
-            template = self._j2_env.get_template("notify.j2")
             data = self._create_data_for_create_notify_text(detail_data)
-            notify_text = template.render(data)
+            notify_text = self._notify_template.render(data)
             return notify_text
         except Exception:
             self._logger.error("通知文の作成に失敗")
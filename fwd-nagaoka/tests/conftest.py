@@ -0,0 +1,25 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from fwdutil import config
+
+# テスト用のVariableディレクトリを使用するよう、設定ファイルデータを差し替える
+# （fwdutil.database_manager のimport時にDBファイルのパスが決定されるため、最初に行う）
+_VARIABLE_DIR = Path(tempfile.mkdtemp(prefix="fwd_test_"))
+config._load_setting_data = lambda: {
+    "variable_dir": str(_VARIABLE_DIR),
+    "nagaoka": {"webhook_url": "http://localhost/webhook"},
+}
+
+from fwdnagaoka.datamodel import Base, create_table_all  # noqa: E402
+from fwdutil import database_manager  # noqa: E402
+
+
+@pytest.fixture
+def database():
+    """テストごとに空のテーブルを作成する"""
+    Base.metadata.drop_all(bind=database_manager.ENGINE)
+    create_table_all()
+    yield database_manager.ENGINE
+    database_manager.ENGINE.dispose()
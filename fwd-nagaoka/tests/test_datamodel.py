@@ -0,0 +1,102 @@
+import sqlalchemy
+from fwdnagaoka.datamodel import (
+    DATABASE_VERSION,
+    Base,
+    DatabaseInfo,
+    DisasterMainCategory,
+    DisasterStatus,
+    NagaokaDisasterDetail,
+    NagaokaRawText,
+    NagaokaWebpageInfo,
+    NotifyStatus,
+    TextPosition,
+    create_table_all,
+    upgrade_database,
+)
+from fwdutil import database_manager
+
+# バージョン1（Enumを名前の文字列で保存）のテーブル定義とデータ
+VERSION_1_SQL = """
+CREATE TABLE _database_info (
+    id INTEGER NOT NULL, version INTEGER NOT NULL, PRIMARY KEY (id)
+);
+CREATE TABLE nagaoka_raw_text (
+    id INTEGER NOT NULL, raw_text VARCHAR NOT NULL, retr_dt DATETIME NOT NULL,
+    text_pos VARCHAR(4) NOT NULL, notify_status VARCHAR(8) NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE TABLE nagaoka_disaster_detail (
+    raw_text_id INTEGER NOT NULL, main_category VARCHAR(4) NOT NULL,
+    sub_category VARCHAR, open_dt DATETIME NOT NULL, close_dt DATETIME,
+    status VARCHAR(4) NOT NULL, address1 VARCHAR, address2 VARCHAR NOT NULL,
+    address3 VARCHAR, PRIMARY KEY (raw_text_id),
+    FOREIGN KEY(raw_text_id) REFERENCES nagaoka_raw_text (id) ON DELETE CASCADE
+);
+INSERT INTO nagaoka_raw_text VALUES
+    (1, 'text1', '2023-10-15 10:10:00.000000', 'CURR', 'NOTIFIED'),
+    (2, 'text2', '2023-10-15 10:10:00.000000', 'PAST', 'SKIPPED'),
+    (3, 'text1', '2023-10-15 10:20:00.000000', 'CURR', 'NOT_YET');
+INSERT INTO nagaoka_disaster_detail VALUES
+    (1, '火災', '建物火災', '2023-10-15 10:00:00.000000', NULL, '発生',
+     NULL, '東町', NULL),
+    (2, '救助', '救助', '2023-10-15 09:00:00.000000', NULL, '終了',
+     NULL, '西町', NULL),
+    (3, '火災', '建物火災', '2023-10-15 10:00:00.000000', NULL, '発生',
+     NULL, '東町', NULL);
+"""
+
+
+def test_create_table_all_upgrades_version_1_database():
+    Base.metadata.drop_all(bind=database_manager.ENGINE)
+    connection = database_manager.ENGINE.raw_connection()
+    try:
+        connection.driver_connection.executescript(VERSION_1_SQL)
+    finally:
+        connection.close()
+
+    create_table_all()
+
+    with database_manager.SESSION() as session:
+        assert session.get(DatabaseInfo, 1).version == DATABASE_VERSION
+
+        # 重複した文字列（id=3）とその解析結果は移さない
+        raw_text_list = session.scalars(
+            sqlalchemy.select(NagaokaRawText).order_by(NagaokaRawText.id)
+        ).all()
+        assert [
+            (raw_text.id, raw_text.text_pos, raw_text.notify_status)
+            for raw_text in raw_text_list
+        ] == [
+            (1, TextPosition.CURR, NotifyStatus.NOTIFIED),
+            (2, TextPosition.PAST, NotifyStatus.SKIPPED),
+        ]
+        detail_list = session.scalars(
+            sqlalchemy.select(NagaokaDisasterDetail).order_by(
+                NagaokaDisasterDetail.raw_text_id
+            )
+        ).all()
+        assert [
+            (detail.raw_text_id, detail.main_category, detail.status)
+            for detail in detail_list
+        ] == [
+            (1, DisasterMainCategory.火災, DisasterStatus.発生),
+            (2, DisasterMainCategory.救助, DisasterStatus.終了),
+        ]
+
+
+def test_upgrade_database_creates_tables_added_in_version_2():
+    Base.metadata.drop_all(bind=database_manager.ENGINE)
+    connection = database_manager.ENGINE.raw_connection()
+    try:
+        connection.driver_connection.executescript(VERSION_1_SQL)
+    finally:
+        connection.close()
+
+    upgrade_database()
+
+    with database_manager.ENGINE.connect() as connection:
+        assert sqlalchemy.inspect(connection).has_table(
+            NagaokaWebpageInfo.__tablename__
+        )
+    with database_manager.SESSION() as session:
+        assert session.get(DatabaseInfo, 1).version == DATABASE_VERSION
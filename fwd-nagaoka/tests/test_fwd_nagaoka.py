@@ -0,0 +1,209 @@
+import datetime
+import logging
+from unittest import mock
+
+import pytest
+import requests
+import sqlalchemy
+from fwdnagaoka.datamodel import (
+    NagaokaDisasterDetail,
+    NagaokaRawText,
+    NagaokaWebpageInfo,
+    NotifyStatus,
+    TextPosition,
+)
+from fwdnagaoka.fwd_nagaoka import FwdNagaoka
+from fwdutil import database_manager
+
+WEBPAGE_TEXT = """<html>
+↓現在発生している災害↓
+<span>10月15日 10:05 長岡市 東町 1丁目に火災のため消防車が出動しました。</span>
+<span>10月15日 09:30 見附市 本町 1丁目に救急支援のため消防車が出動しました。</span>
+↑現在発生している災害↑
+↓過去の災害経過情報↓
+<span>10月14日 22:10 長岡市 西町 2丁目の建物火災は23:40鎮火しました。</span>
+<span>10月14日 20:00 長岡市 南町 3丁目の警戒は消火の必要はありませんでした。</span>
+<span>10月13日 08:00 長岡市 北町 4丁目の救助は09:10救助終了しました。</span>
+↑過去の災害経過情報↑
+</html>"""
+
+
+def _execute(webpage_text, post_side_effect=None):
+    with mock.patch(
+        "fwdutil.request_wrapper.download_webpage_if_modified",
+        return_value=(webpage_text, '"etag"', None),
+    ), mock.patch(
+        "fwdutil.request_wrapper.post_to_discord", side_effect=post_side_effect
+    ) as post_to_discord:
+        FwdNagaoka().execute()
+    return post_to_discord
+
+
+def _execute_with_response(status_code, webpage_text="", headers=None):
+    response = mock.Mock(
+        status_code=status_code,
+        content=webpage_text.encode(FwdNagaoka.WEBPAGE_ENC),
+        headers=headers or {},
+    )
+    with mock.patch(
+        "fwdutil.request_wrapper._SESSION.get", return_value=response
+    ) as session_get, mock.patch("fwdutil.request_wrapper.post_to_discord"):
+        FwdNagaoka().execute()
+    return session_get
+
+
+def _load_webpage_info():
+    with database_manager.SESSION() as session:
+        webpage_info = session.get(NagaokaWebpageInfo, 1)
+        if webpage_info is None:
+            return None
+        return webpage_info.etag, webpage_info.last_modified
+
+
+def _notify_status_list() -> list[NotifyStatus]:
+    with database_manager.SESSION() as session:
+        return session.scalars(
+            sqlalchemy.select(NagaokaRawText.notify_status).order_by(NagaokaRawText.id)
+        ).all()
+
+
+def _count(model) -> int:
+    with database_manager.SESSION() as session:
+        return session.scalar(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(model)
+        )
+
+
+@pytest.mark.usefixtures("database")
+def test_execute_registers_raw_text_once(caplog):
+    caplog.set_level(logging.INFO, logger="fwd.nagaoka")
+
+    _execute(WEBPAGE_TEXT)
+    assert _count(NagaokaRawText) == 5
+    assert _count(NagaokaDisasterDetail) == 5
+    assert "災害情報登録完了 件数=[5]" in caplog.text
+    caplog.clear()
+
+    # 同じ文字列は再登録しない
+    _execute(WEBPAGE_TEXT)
+    assert _count(NagaokaRawText) == 5
+    assert "災害情報登録完了 件数=[0]" in caplog.text
+
+
+@pytest.mark.usefixtures("database")
+def test_store_old_data_registers_with_retrieve_dt(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="fwd.nagaoka")
+    (tmp_path / "20231015_1010.txt").write_text(WEBPAGE_TEXT, encoding="utf-8")
+
+    FwdNagaoka().store_old_data(str(tmp_path))
+
+    assert "災害情報の登録件数=[5]" in caplog.text
+    with database_manager.SESSION() as session:
+        raw_text_list = session.scalars(
+            sqlalchemy.select(NagaokaRawText).order_by(NagaokaRawText.id)
+        ).all()
+        assert [raw_text.text_pos for raw_text in raw_text_list] == [
+            TextPosition.CURR
+        ] * 2 + [TextPosition.PAST] * 3
+        assert all(
+            raw_text.retr_dt == datetime.datetime(2023, 10, 15, 10, 10)
+            and raw_text.notify_status == NotifyStatus.SKIPPED
+            for raw_text in raw_text_list
+        )
+
+
+@pytest.mark.usefixtures("database")
+def test_execute_keeps_raw_text_that_cannot_be_analyzed(caplog):
+    caplog.set_level(logging.INFO, logger="fwd.nagaoka")
+    webpage_text = WEBPAGE_TEXT.replace(
+        "↑現在発生している災害↑",
+        "<span>10月15日 11:00 長岡市 東町で火災が発生しました。</span>\n"
+        "↑現在発生している災害↑",
+    )
+
+    _execute(webpage_text)
+
+    # 解析できない文字列も登録し、他の文字列の解析結果は保存する
+    assert _count(NagaokaRawText) == 6
+    assert _count(NagaokaDisasterDetail) == 5
+
+    # 解析できない文字列のログは、トレースバックなしで一度だけ出力する
+    failed_records = [
+        record for record in caplog.records if record.levelno >= logging.WARNING
+    ]
+    assert len(failed_records) == 1
+    assert failed_records[0].exc_info is None
+    assert "東町で火災が発生しました" in failed_records[0].getMessage()
+
+
+@pytest.mark.usefixtures("database")
+def test_notify_keeps_notified_status_when_interrupted():
+    # 3件目の通知成功後（一定件数ごとの更新の途中）に処理が中断した場合
+    with mock.patch("fwdnagaoka.fwd_nagaoka._FETCH_CHUNK_SIZE", 2):
+        with pytest.raises(KeyboardInterrupt):
+            _execute(WEBPAGE_TEXT, [None, None, None, KeyboardInterrupt])
+
+    # 通知済みの災害情報は再通知しないよう、通知済みに更新されている
+    assert (
+        _notify_status_list()
+        == [NotifyStatus.NOTIFIED] * 3 + [NotifyStatus.NOT_YET] * 2
+    )
+
+
+@pytest.mark.usefixtures("database")
+def test_notify_stops_at_first_failure():
+    post_to_discord = _execute(
+        WEBPAGE_TEXT, [None, requests.ConnectionError, None, None, None]
+    )
+
+    # 通知に失敗した災害情報以降は通知せず、次回実行時に登録順に通知する
+    assert post_to_discord.call_count == 2
+    assert _notify_status_list() == [NotifyStatus.NOTIFIED] + [NotifyStatus.NOT_YET] * 4
+
+    post_to_discord = _execute(WEBPAGE_TEXT)
+    assert post_to_discord.call_count == 4
+    assert _notify_status_list() == [NotifyStatus.NOTIFIED] * 5
+
+
+@pytest.mark.usefixtures("database")
+def test_execute_sends_conditional_get_with_saved_validators():
+    # 初回は条件付きGETのヘッダを送信せず、取得したETag, Last-Modifiedを保存する
+    session_get = _execute_with_response(
+        200,
+        WEBPAGE_TEXT,
+        {"ETag": '"v1"', "Last-Modified": "Sun, 15 Oct 2023 01:10:00 GMT"},
+    )
+    assert session_get.call_args.kwargs["headers"] == {}
+    assert _load_webpage_info() == ('"v1"', "Sun, 15 Oct 2023 01:10:00 GMT")
+
+    # 2回目以降は保存したETag, Last-Modifiedを条件付きGETのヘッダとして送信する
+    session_get = _execute_with_response(304)
+    assert session_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sun, 15 Oct 2023 01:10:00 GMT",
+    }
+    assert _load_webpage_info() == ('"v1"', "Sun, 15 Oct 2023 01:10:00 GMT")
+
+
+@pytest.mark.usefixtures("database")
+def test_execute_analyzes_pending_raw_text_when_not_modified():
+    # 解析前に処理が終了し、未解析の災害情報が残っている場合
+    with mock.patch.object(FwdNagaoka, "_analyze"):
+        _execute_with_response(200, WEBPAGE_TEXT, {"ETag": '"v1"'})
+    assert _count(NagaokaRawText) == 5
+    assert _count(NagaokaDisasterDetail) == 0
+
+    # Webページが更新されていない場合も、災害情報の登録のみスキップし解析は行う
+    _execute_with_response(304)
+    assert _count(NagaokaRawText) == 5
+    assert _count(NagaokaDisasterDetail) == 5
+
+
+@pytest.mark.usefixtures("database")
+def test_execute_does_not_save_validators_when_analyze_fails():
+    with mock.patch.object(FwdNagaoka, "_analyze", side_effect=RuntimeError):
+        _execute_with_response(200, WEBPAGE_TEXT, {"ETag": '"v1"'})
+
+    # 解析に失敗した場合は、次回実行時に再取得するようWebページの情報も保存しない
+    assert _load_webpage_info() is None
+    assert _count(NagaokaRawText) == 0
@@ -1,12 +1,27 @@
+import functools
+import os
 from pathlib import Path
 
 import yaml
 
+# YAMLの読み込みには、利用可能な場合はC実装のLoaderを使用する
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # 設定ファイルパス
 CONFIGFILE_PATH = Path(__file__).parents[3] / "config" / "fwd_config.yaml"
 
-# 設定ファイルデータ（ファイルI/O削減のためキャッシュする）
-SETTING_DATA = None
+
+@functools.lru_cache(maxsize=1)
+def _load_setting_data() -> dict:
+    """設定ファイルデータを読み出す（ファイルI/O削減のため、読み出し結果をキャッシュする）
+
+    Returns:
+        dict: 設定ファイルデータ
+    """
+    return yaml.load(CONFIGFILE_PATH.read_bytes(), Loader=_YamlLoader)
 
 
 def get_variable_dir() -> Path:
@@ -20,13 +35,11 @@ def get_variable_dir() -> Path:
         Path: Variableディレクトリのパス
     """
 
-    # 設定ファイルデータが読み込まれていない場合、データを読み出す
-    global SETTING_DATA
-    if SETTING_DATA is None:
-        SETTING_DATA = yaml.safe_load(CONFIGFILE_PATH.read_text(encoding="utf-8"))
+    # 設定ファイルデータを取得する
+    setting_data = _load_setting_data()
 
     # 読み出したデータをPathに変換する
-    if not (variable_dir := SETTING_DATA.get("variable_dir")):
+    if not (variable_dir := setting_data.get("variable_dir")):
         raise ValueError("variable_dir未定義")
     try:
         variable_path = Path(variable_dir)
@@ -49,14 +62,21 @@ def get_webhook_url(city_name: str) -> str:
         str: Webhook URL
     """
 
-    # 設定ファイルデータが読み込まれていない場合、データを読み出す
-    global SETTING_DATA
-    if SETTING_DATA is None:
-        SETTING_DATA = yaml.safe_load(CONFIGFILE_PATH.read_text(encoding="utf-8"))
+    # 設定ファイルデータを取得する
+    setting_data = _load_setting_data()
 
     # Webhook URLを取得する
-    if not SETTING_DATA.get(city_name):
+    if not setting_data.get(city_name):
         raise ValueError("指定した都市名の設定ブロック未定義")
-    if not (webhook_url := SETTING_DATA.get(city_name).get("webhook_url")):
+    if not (webhook_url := setting_data.get(city_name).get("webhook_url")):
         raise ValueError("webhook_url未定義")
     return webhook_url
+
+
+def is_sql_echo_enabled() -> bool:
+    """SQLのログ出力が有効か（環境変数FWD_SQL_ECHO=1が設定されているか）を取得する
+
+    Returns:
+        bool: SQLのログ出力が有効な場合はTrue
+    """
+    return os.environ.get("FWD_SQL_ECHO") == "1"
@@ -14,8 +14,9 @@ db_filepath = variable_dir / "database" / "fwd.db"
 db_filepath.parent.mkdir(exist_ok=True)
 
 # Engine, Session設定
+# SQLのログ出力はクエリ毎に処理時間がかかるため、環境変数FWD_SQL_ECHO=1の場合のみ行う
 UB_URL: Final[str] = f"sqlite:///{db_filepath.as_posix()}"
-ENGINE = create_engine(UB_URL, echo=True)
+ENGINE = create_engine(UB_URL, echo=config.is_sql_echo_enabled())
 SESSION = sessionmaker(autocommit=False, autoflush=False, bind=ENGINE)
 
 
@@ -32,11 +33,25 @@ def session_factory():
     except Exception:
         session.rollback()
         raise
+    finally:
+        session.close()
+
+
+# 接続時に設定するsqliteのpragma
+# 外部キー制約の強制に加え、書き込み性能向上のための設定を行う
+SQLITE_PRAGMAS: Final[tuple[str, ...]] = (
+    "foreign_keys=ON",  # 外部キー制約を強制する
+    "journal_mode=WAL",  # コミット時のfsyncを削減する
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",  # 一時テーブル・インデックスをメモリ上に作成する
+    "cache_size=-20000",  # ページキャッシュを約20MBとする
+    "mmap_size=134217728",  # 128MBまでメモリマップドI/Oで読み出す
+)
 
 
-# sqlite 外部キー制約を強制するpragma
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON ")
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
     cursor.close()
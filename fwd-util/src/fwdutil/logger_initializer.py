@@ -1,8 +1,10 @@
-from logging import config
+from logging import INFO, WARNING, config, getLogger
 from pathlib import Path
 
 import yaml
 
+from fwdutil.config import is_sql_echo_enabled
+
 
 def initialize(logger_config_file: Path):
     try:
@@ -23,6 +25,12 @@ def initialize(logger_config_file: Path):
         # ログ設定情報をloggingモジュールに設定する
         config.dictConfig(setting_data)
 
+        # SQLのログ出力は、ログ設定ファイルの設定によらず環境変数FWD_SQL_ECHOで切り替える
+        # （dictConfig()はEngineのecho設定によるloggerのレベルをリセットするため、ここで設定する）
+        getLogger("sqlalchemy.engine").setLevel(
+            INFO if is_sql_echo_enabled() else WARNING
+        )
+
     except Exception as err:
         # エラー処理
         # loggerモジュールの初期化に失敗したためログファイルへの保存は出来ないため
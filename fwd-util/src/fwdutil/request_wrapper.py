@@ -1,7 +1,18 @@
 import unicodedata
 from logging import getLogger
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# HTTP通信に使用するセッション
+# 定期実行の度にTCP接続を確立し直さないよう、接続を使い回す（keep-alive）
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# logger
+_LOG = getLogger("requests")
 
 
 def download_webpage(webpage_url: str, webpage_enc: str, timeout_sec=10) -> str:
@@ -15,34 +26,76 @@ def download_webpage(webpage_url: str, webpage_enc: str, timeout_sec=10) -> str:
     Returns:
         str: 取得したWebページのテキスト
     """
-    try:
-        # loggerを取得
-        logger = getLogger("requests")
+    text_data, _, _ = download_webpage_if_modified(
+        webpage_url, webpage_enc, timeout_sec=timeout_sec
+    )
+    return text_data
+
+
+def download_webpage_if_modified(
+    webpage_url: str,
+    webpage_enc: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    timeout_sec=10,
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """出動情報が掲載されているWebページの情報を、前回取得時から更新されている場合のみ取得する
+
+    etag, last_modified を指定した場合は条件付きGETを行い、
+    Webページが更新されていなければ（304 Not Modified）テキストを取得しない。
+
+    Args:
+        webpage_url (str): WebページのURL
+        webpage_enc (str): Webページのエンコーディング
+        etag (Optional[str], optional): 前回取得時のETag. Defaults to None.
+        last_modified (Optional[str], optional): 前回取得時のLast-Modified. Defaults to None.
+        timeout_sec (int, optional): Webページのダウンロードタイムアウト（秒）. Defaults to 10.
+
+    Returns:
+        tuple[Optional[str], Optional[str], Optional[str]]:
+            取得したWebページのテキスト（更新されていない場合はNone）、ETag、Last-Modified
+    """
+    # 前回取得時の情報から条件付きGETのヘッダを作成する
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
+    try:
         # WebpageデータをGET
-        logger.info(f"GET: {webpage_url}")
-        res = requests.get(webpage_url, timeout=timeout_sec)  # GET処理
+        _LOG.info("GET: %s", webpage_url)
+        res = _SESSION.get(webpage_url, headers=headers, timeout=timeout_sec)  # GET処理
         res.raise_for_status()  # HTTPレスポンスコードに応じたExceptionをraiseする
 
-        # 取得成功した場合、取得データのエンコード、正規化を行い返却
-        logger.info(
-            f"Download SUCCEED. Status={res.status_code}, Length={len(res.text)}."
+        # 更新されていない場合、テキストは返却せず前回取得時の情報を返却
+        if res.status_code == requests.codes.not_modified:
+            _LOG.info("Download SKIPPED. Not modified, Status=%d.", res.status_code)
+            return None, etag, last_modified
+
+        # 取得成功した場合、取得データのデコード、正規化を行い返却
+        # （res.textはエンコーディングの自動判定を行うため使用せず、指定のエンコーディングで直接デコードする）
+        raw_data: bytes = res.content
+        _LOG.info(
+            "Download SUCCEED. Status=%d, Length=%d.", res.status_code, len(raw_data)
         )
-        res.encoding = webpage_enc
-        text_data: str = unicodedata.normalize("NFKC", res.text)
-        return text_data
+        text_data: str = unicodedata.normalize(
+            "NFKC", raw_data.decode(webpage_enc, errors="replace")
+        )
+        return text_data, res.headers.get("ETag"), res.headers.get("Last-Modified")
 
+    # 接続失敗・タイムアウト時はレスポンスが無いため、ステータスコードは出力しない
     except requests.ConnectionError:
-        logger.error(f"Download FAILED. ConnectionError, Status={res.status_code}.")
+        _LOG.error("Download FAILED. ConnectionError.")
         raise
-    except requests.HTTPError:
-        logger.error(f"Download FAILED. HTTPError, Status={res.status_code}.")
+    except requests.HTTPError as err:
+        _LOG.error("Download FAILED. HTTPError, Status=%d.", err.response.status_code)
         raise
     except requests.Timeout:
-        logger.error(f"Download FAILED. Timeout, Status={res.status_code}.")
+        _LOG.error("Download FAILED. Timeout.")
         raise
-    except requests.RequestException:
-        logger.error(f"Download FAILED. RequestException, Status={res.status_code}.")
+    except requests.RequestException as err:
+        _LOG.error("Download FAILED. RequestException, %s.", err)
         raise
 
 
@@ -55,26 +108,24 @@ def post_to_discord(webhook_url: str, message: str, timeout_sec=10):
         timeout_sec (int, optional): 送信時のタイムアウト（秒）. Defaults to 10.
     """
     try:
-        # loggerを取得
-        logger = getLogger("requests")
-
         # DiscordのWebhookにPOSTする
-        logger.info(f"POST: {webhook_url}")
-        res = requests.post(webhook_url, json={"content": message}, timeout=timeout_sec)
+        _LOG.info("POST: %s", webhook_url)
+        res = _SESSION.post(webhook_url, json={"content": message}, timeout=timeout_sec)
         res.raise_for_status()  # HTTPレスポンスコードに応じたExceptionをraiseする
 
         # POST成功ログ
-        logger.info(f"Post SUCCEED. Status={res.status_code}.")
+        _LOG.info("Post SUCCEED. Status=%d.", res.status_code)
 
+    # 接続失敗・タイムアウト時はレスポンスが無いため、ステータスコードは出力しない
     except requests.ConnectionError:
-        logger.error(f"Post FAILED. ConnectionError, Status={res.status_code}.")
+        _LOG.error("Post FAILED. ConnectionError.")
         raise
-    except requests.HTTPError:
-        logger.error(f"Post FAILED. HTTPError, Status={res.status_code}.")
+    except requests.HTTPError as err:
+        _LOG.error("Post FAILED. HTTPError, Status=%d.", err.response.status_code)
         raise
     except requests.Timeout:
-        logger.error(f"Post FAILED. Timeout, Status={res.status_code}.")
+        _LOG.error("Post FAILED. Timeout.")
         raise
-    except requests.RequestException:
-        logger.error(f"Post FAILED. RequestException, Status={res.status_code}.")
+    except requests.RequestException as err:
+        _LOG.error("Post FAILED. RequestException, %s.", err)
         raise